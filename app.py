@@ -1,19 +1,49 @@
 import os
 import json
 import datetime
-import random
-from flask import Flask, request, jsonify
+import re
+import secrets
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+import httplib2
+import orjson
+from flask import Flask, Response, request, jsonify, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 # Always load .env from the same folder as app.py (backend/)
 _BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 load_dotenv(os.path.join(_BASE_DIR, ".env"))
 
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, used by every jsonify() call."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping a decode
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype="application/json")
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app, resources={r"/api/*": {"origins": "*"}})
 
 SPREADSHEET_ID = os.getenv("SPREADSHEET_ID", "").strip()
@@ -21,6 +51,13 @@ CREDS_FILE = os.getenv("GOOGLE_CREDENTIALS_FILE", "credentials.json").strip()
 SHEET1 = os.getenv("SHEET1_NAME", "Sheet1").strip() or "Sheet1"
 SHEET2 = os.getenv("SHEET2_NAME", "Sheet2").strip() or "Sheet2"
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+SHEET1_CACHE_TTL = int(os.getenv("SHEET1_CACHE_TTL", "300"))  # seconds
+HTTP_TIMEOUT = 30  # seconds per Sheets API call
+HTTP_POOL_SIZE = 50
+
+# Optional local SQLite system-of-record for tasks. When set, Sheet2 becomes a
+# mirror that is seeded from once and then only written to by this API.
+TASK_DB_PATH = os.getenv("TASK_DB_PATH", "").strip()
 
 # ── Sheet2 column order (0-indexed)
 COL = {
@@ -40,9 +77,84 @@ COL = {
 }
 NUM_COLS = 13
 
-
-def get_service():
-    """Create and return Google Sheets API service.
+# ── Keys of each task object returned by the API, in Sheet2 column order
+TASK_KEYS = ("rowIndex",) + tuple(sorted(COL, key=COL.get))
+
+# ── Statuses that take a task off the active list (and finish it)
+INACTIVE_STATUSES = ("Completed", "Cancelled")
+
+# ── Above this many separate runs of active rows, /api/tasks/active reads
+#    the whole sheet instead of fetching the runs individually
+MAX_ACTIVE_RANGES = 100
+
+# ── Most tasks accepted by one /api/tasks/bulk call, keeping the append and
+#    its metadata batchUpdate well inside Sheets request-size limits
+MAX_BULK_TASKS = 100
+
+# ── Tasks per chunk when streaming task lists
+STREAM_CHUNK_ROWS = 500
+
+# ── Columns drawn from a small set of repeating values; interned so large
+#    task lists share one string object per distinct value
+INTERNED_COLS = tuple(
+    COL[k] for k in ("Tastype", "Employee Name", "Collegaue", "Status", "Task Delivery Status")
+)
+
+# ── Shared Sheets client (built once, reused by every request)
+_SHEETS_SINGLETON = None
+_SHEETS_LOCK = threading.Lock()
+_SHEET2_READY = False
+_SHEET2_ID = None  # numeric sheetId of Sheet2, needed for row metadata
+
+# ── Sheet2 writes run on a single background thread so handlers can reply
+#    without waiting on Google; one worker keeps writes in submission order.
+_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheets-writer")
+_WRITE_LOCK = threading.Lock()
+_LAST_WRITE = None
+WRITE_RETRIES = 3
+WRITE_RETRY_DELAY = 1.0  # seconds before the first append retry, doubled after
+
+# ── Background writes that still failed after retrying, reported by /api/health
+_FAILED_WRITE_COUNT = 0
+_FAILED_WRITE_IDS = deque(maxlen=50)  # Task IDs, most recent last
+
+# ── Local task database (only used when TASK_DB_PATH is set)
+_TASK_DB = None
+_TASK_DB_LOCK = threading.Lock()
+DB_COLUMNS = (
+    "date",
+    "tastype",
+    "business_id",
+    "tat",
+    "description",
+    "employee_name",
+    "colleague",
+    "status",
+    "status_changed_on",
+    "days_required",
+    "days_taken",
+    "delivery_status",
+    "id",
+)
+_DB_INSERT_SQL = (
+    f"INSERT INTO tasks (row_index, dirty, {', '.join(DB_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * (NUM_COLS + 2))})"
+)
+_DB_SELECT_SQL = f"SELECT row_index, {', '.join(DB_COLUMNS)} FROM tasks"
+_DB_DIRTY_SQL = (
+    f"SELECT row_index, dirty, {', '.join(DB_COLUMNS)} FROM tasks "
+    "WHERE dirty != 0 ORDER BY row_index"
+)
+
+# ── Developer metadata key used to tag each task row with its Task ID
+TASK_METADATA_KEY = "taskId"
+
+# ── Sheet1 master data rarely changes, so keep the last payload around
+_SHEET1_CACHE = {"ts": 0, "payload": None}
+
+
+def _load_credentials():
+    """Load service account credentials.
 
     Prefers JSON from environment variable GOOGLE_SERVICE_ACCOUNT_JSON
     (for cloud hosting like Render), and falls back to a local file
@@ -57,29 +169,112 @@ def get_service():
         creds_path = os.path.join(_BASE_DIR, CREDS_FILE)
         creds = Credentials.from_service_account_file(creds_path, scopes=SCOPES)
 
-    service = build("sheets", "v4", credentials=creds)
-    return service.spreadsheets()
+    return creds
+
+
+class SessionHttp:
+    """
+    Minimal httplib2.Http stand-in backed by a pooled requests session.
+
+    googleapiclient only needs request() and close(); routing them through
+    an AuthorizedSession keeps TLS connections alive across API calls and is
+    safe to share between worker threads, unlike httplib2.Http.
+    """
+
+    def __init__(self, session, timeout=HTTP_TIMEOUT):
+        self.session = session
+        self.timeout = timeout
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        resp = self.session.request(
+            method, uri, data=body, headers=headers, timeout=self.timeout
+        )
+        info = dict(resp.headers)
+        info["status"] = str(resp.status_code)
+        response = httplib2.Response(info)
+        response.reason = resp.reason
+        return response, resp.content
+
+    def close(self):
+        self.session.close()
+
+
+def _authorized_http(creds):
+    """Build the shared, connection-pooled transport for the Sheets client."""
+    session = AuthorizedSession(creds)
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=3,
+    )
+    session.mount("https://", adapter)
+    return SessionHttp(session)
+
+
+def get_service():
+    """Return the shared Google Sheets API spreadsheets() handle.
+
+    The client is built lazily on first use and cached at module scope so
+    credentials, discovery and the authorized HTTP connection are reused
+    across requests instead of being rebuilt every time.
+    """
+    global _SHEETS_SINGLETON
+
+    if _SHEETS_SINGLETON is None:
+        with _SHEETS_LOCK:
+            if _SHEETS_SINGLETON is None:
+                service = build(
+                    "sheets",
+                    "v4",
+                    http=_authorized_http(_load_credentials()),
+                    cache_discovery=False,
+                )
+                _SHEETS_SINGLETON = service.spreadsheets()
+
+    return _SHEETS_SINGLETON
 
 
 def ensure_sheet2_with_header():
     """
     Ensure Sheet2 exists in the spreadsheet and has the correct header row.
     Returns the spreadsheets() service handle.
+
+    The check only hits the API until it has succeeded once; after that the
+    tab and header are assumed to be in place for the life of the process.
     """
+    global _SHEET2_READY, _SHEET2_ID
+
     sheets = get_service()
+    if _SHEET2_READY:
+        return sheets
 
-    # Ensure the sheet/tab itself exists
+    # Fetch tab titles and the header row in a single round-trip
+    header_range = f"{SHEET2}!A1:M1"
     try:
-        meta = sheets.get(spreadsheetId=SPREADSHEET_ID).execute()
+        meta = sheets.get(
+            spreadsheetId=SPREADSHEET_ID,
+            ranges=[header_range],
+            includeGridData=True,
+            fields="sheets.properties(sheetId,title),sheets.data.rowData.values.formattedValue",
+        ).execute()
     except HttpError as e:
-        raise
+        # A range on a missing tab is rejected outright — fall back to
+        # listing titles so the tab can be created below.
+        if e.resp.status != 400:
+            raise
+        meta = sheets.get(
+            spreadsheetId=SPREADSHEET_ID,
+            fields="sheets.properties(sheetId,title)",
+        ).execute()
 
-    existing_titles = [
-        s.get("properties", {}).get("title", "")
-        for s in meta.get("sheets", [])
-    ]
+    sheet2_meta = None
+    for s in meta.get("sheets", []):
+        if s.get("properties", {}).get("title", "") == SHEET2:
+            sheet2_meta = s
+            break
 
-    if SHEET2 not in existing_titles:
+    # Ensure the sheet/tab itself exists
+    if sheet2_meta is None:
         body = {
             "requests": [
                 {
@@ -91,16 +286,23 @@ def ensure_sheet2_with_header():
                 }
             ]
         }
-        sheets.batchUpdate(spreadsheetId=SPREADSHEET_ID, body=body).execute()
+        reply = sheets.batchUpdate(spreadsheetId=SPREADSHEET_ID, body=body).execute()
+        sheet2_meta = {
+            "properties": reply["replies"][0]["addSheet"]["properties"],
+        }
+
+    _SHEET2_ID = sheet2_meta["properties"].get("sheetId", 0)
 
     # Ensure header row exists
-    header_range = f"{SHEET2}!A1:M1"
-    existing_header = sheets.values().get(
-        spreadsheetId=SPREADSHEET_ID,
-        range=header_range,
-    ).execute()
+    existing_header = [
+        cell.get("formattedValue")
+        for grid in sheet2_meta.get("data", [])
+        for row in grid.get("rowData", [])
+        for cell in row.get("values", [])
+        if cell.get("formattedValue")
+    ]
 
-    if not existing_header.get("values"):
+    if not existing_header:
         header = [
             "Date",
             "Tastype",
@@ -123,9 +325,449 @@ def ensure_sheet2_with_header():
             body={"values": [header]},
         ).execute()
 
+    _SHEET2_READY = True
     return sheets
 
 
+def tag_task_rows(sheets, task_ids, first_row):
+    """
+    Attach each Task ID as developer metadata on consecutive Sheet2 rows,
+    starting at first_row (1-indexed). All tags go out in one batchUpdate.
+    """
+    body = {
+        "requests": [
+            {
+                "createDeveloperMetadata": {
+                    "developerMetadata": {
+                        "metadataKey": TASK_METADATA_KEY,
+                        "metadataValue": task_id,
+                        "location": {
+                            "dimensionRange": {
+                                "sheetId": _SHEET2_ID,
+                                "dimension": "ROWS",
+                                "startIndex": row_number - 1,
+                                "endIndex": row_number,
+                            }
+                        },
+                        "visibility": "DOCUMENT",
+                    }
+                }
+            }
+            for row_number, task_id in enumerate(task_ids, start=first_row)
+        ]
+    }
+    sheets.batchUpdate(spreadsheetId=SPREADSHEET_ID, body=body).execute()
+
+
+def find_task_row(sheets, task_id):
+    """
+    Locate a task in Sheet2 by its Task ID.
+    Returns (row_number, row) with a 1-indexed row number, or (None, None).
+
+    Rows tagged by tag_task_rows() are resolved through a developer metadata
+    search and a single-row read; untagged (older) rows fall back to
+    scanning the whole sheet.
+    """
+    found = sheets.developerMetadata().search(
+        spreadsheetId=SPREADSHEET_ID,
+        body={
+            "dataFilters": [
+                {
+                    "developerMetadataLookup": {
+                        "metadataKey": TASK_METADATA_KEY,
+                        "metadataValue": task_id,
+                    }
+                }
+            ]
+        },
+    ).execute()
+
+    for match in found.get("matchedDeveloperMetadata", []):
+        location = match.get("developerMetadata", {}).get("location", {})
+        dim_range = location.get("dimensionRange", {})
+        if dim_range.get("sheetId", 0) != _SHEET2_ID or "startIndex" not in dim_range:
+            continue
+        row_number = dim_range["startIndex"] + 1
+        result = sheets.values().get(
+            spreadsheetId=SPREADSHEET_ID,
+            range=f"{SHEET2}!A{row_number}:M{row_number}",
+            fields="values",
+        ).execute()
+        rows = result.get("values", [])
+        # Guard against the tag drifting from the row (e.g. after a sort)
+        if rows and safe_get(rows[0], COL["ID"]).strip() == task_id:
+            return row_number, rows[0]
+
+    result = sheets.values().get(
+        spreadsheetId=SPREADSHEET_ID,
+        range=f"{SHEET2}!A:M",
+        fields="values",
+    ).execute()
+    id_col = COL["ID"]
+    for i, row in enumerate(result.get("values", [])):
+        if len(row) > id_col and row[id_col].strip() == task_id:
+            return i + 1, row  # Sheets is 1-indexed
+
+    return None, None
+
+
+def fetch_active_task_rows(sheets):
+    """
+    Return (row_number, row) pairs for every Sheet2 task that is not
+    Completed or Cancelled.
+
+    Only the Status column is downloaded in full; the active rows are then
+    fetched in one batchGet as runs of consecutive rows, plus an open-ended
+    range for any rows below the last filled Status cell.
+    """
+    status_col = COL["Status"]
+    status_letter = chr(ord("A") + status_col)
+    result = sheets.values().get(
+        spreadsheetId=SPREADSHEET_ID,
+        range=f"{SHEET2}!{status_letter}:{status_letter}",
+        fields="values",
+    ).execute()
+    statuses = result.get("values", [])
+
+    # Group consecutive active rows into [first_row, last_row] runs
+    runs = []
+    for n, cell in enumerate(statuses[1:], start=2):
+        status = cell[0].strip() if cell else ""
+        if status in INACTIVE_STATUSES:
+            continue
+        if runs and runs[-1][1] == n - 1:
+            runs[-1][1] = n
+        else:
+            runs.append([n, n])
+
+    if len(runs) > MAX_ACTIVE_RANGES:
+        # Too scattered to fetch run by run — read the whole sheet instead
+        result = sheets.values().get(
+            spreadsheetId=SPREADSHEET_ID,
+            range=f"{SHEET2}!A:M",
+            fields="values",
+        ).execute()
+        rows = result.get("values", [])
+        return [
+            (i, row)
+            for i, row in enumerate(rows[1:], start=2)
+            if (row[status_col].strip() if len(row) > status_col else "") not in INACTIVE_STATUSES
+        ]
+
+    # Rows below the last Status cell have no status, so they are all active
+    tail_row = max(len(statuses) + 1, 2)
+    ranges = [f"{SHEET2}!A{first}:M{last}" for first, last in runs]
+    ranges.append(f"{SHEET2}!A{tail_row}:M")
+    result = sheets.values().batchGet(
+        spreadsheetId=SPREADSHEET_ID,
+        ranges=ranges,
+        fields="valueRanges.values",
+    ).execute()
+    value_ranges = result.get("valueRanges", [])
+
+    active = []
+    for (first, last), value_range in zip(runs, value_ranges):
+        rows = value_range.get("values", [])
+        for n in range(first, last + 1):
+            # Trailing empty rows are trimmed from the response
+            active.append((n, rows[n - first] if n - first < len(rows) else []))
+    if len(value_ranges) > len(runs):
+        tail = value_ranges[len(runs)].get("values", [])
+        active.extend(enumerate(tail, start=tail_row))
+    return active
+
+
+def _run_write(task_ids, fn, *args):
+    """
+    Run a queued Sheets write. No caller is waiting, so a failure is logged
+    and its Task IDs recorded for /api/health.
+    """
+    global _FAILED_WRITE_COUNT
+
+    try:
+        fn(*args)
+    except Exception:
+        app.logger.exception(
+            "Background Sheets write %s failed for tasks %s", fn.__name__, ", ".join(task_ids)
+        )
+        with _WRITE_LOCK:
+            _FAILED_WRITE_COUNT += 1
+            _FAILED_WRITE_IDS.extend(task_ids)
+
+
+def submit_write(task_ids, fn, *args):
+    """Queue fn(*args), which writes the given tasks, and return immediately."""
+    global _LAST_WRITE
+
+    with _WRITE_LOCK:
+        _LAST_WRITE = _WRITE_EXECUTOR.submit(_run_write, task_ids, fn, *args)
+        return _LAST_WRITE
+
+
+def wait_for_pending_writes():
+    """
+    Block until every write queued so far has reached the sheet.
+    Sheet2 readers call this so a client always sees its own writes.
+    """
+    with _WRITE_LOCK:
+        last = _LAST_WRITE
+    if last is not None:
+        wait([last])
+
+
+def append_task_rows(sheets, rows, task_ids):
+    """
+    Append rows to Sheet2 and return the row number of the first one, or
+    None if the response does not say.
+
+    Append is not idempotent, so it is only retried once the rows are known
+    not to be in the sheet: a 429 is rejected before anything is written,
+    but after a 5xx or a dropped connection the sheet is searched for the
+    first Task ID before trying again.
+    """
+    for attempt in range(WRITE_RETRIES + 1):
+        if attempt:
+            time.sleep(WRITE_RETRY_DELAY * 2 ** (attempt - 1))
+        try:
+            appended = sheets.values().append(
+                spreadsheetId=SPREADSHEET_ID,
+                range=f"{SHEET2}!A:M",
+                valueInputOption="RAW",
+                insertDataOption="INSERT_ROWS",
+                body={"values": rows}
+            ).execute()
+        except HttpError as e:
+            if attempt == WRITE_RETRIES or (e.resp.status != 429 and e.resp.status < 500):
+                raise
+            if e.resp.status == 429:
+                continue
+        except OSError:  # requests' connection errors and timeouts
+            if attempt == WRITE_RETRIES:
+                raise
+        else:
+            updated_range = appended.get("updates", {}).get("updatedRange", "")
+            row_match = re.search(r"!\$?[A-Z]+\$?(\d+)", updated_range)
+            return int(row_match.group(1)) if row_match else None
+
+        row_number, _ = find_task_row(sheets, task_ids[0])
+        if row_number is not None:
+            return row_number
+
+
+def write_new_tasks(rows, task_ids):
+    """Append task rows to Sheet2 in one call and tag them with their Task IDs."""
+    sheets = ensure_sheet2_with_header()
+    first_row = append_task_rows(sheets, rows, task_ids)
+
+    # Tag the new rows with their Task IDs so updates can find them directly.
+    # The rows are already written, so a tagging failure is not fatal —
+    # update_task falls back to a full scan for untagged rows.
+    if first_row is not None:
+        try:
+            tag_task_rows(sheets, task_ids, first_row)
+        except HttpError:
+            app.logger.warning("Could not tag rows for tasks %s", ", ".join(task_ids))
+
+
+def write_task_rows(first_row, rows):
+    """Overwrite consecutive Sheet2 rows, starting at first_row (1-indexed)."""
+    sheets = ensure_sheet2_with_header()
+    last_row = first_row + len(rows) - 1
+    sheets.values().update(
+        spreadsheetId=SPREADSHEET_ID,
+        range=f"{SHEET2}!A{first_row}:M{last_row}",
+        valueInputOption="RAW",
+        body={"values": [row[:NUM_COLS] for row in rows]}
+    ).execute(num_retries=WRITE_RETRIES)
+
+
+def get_task_db():
+    """
+    Return the shared SQLite connection for the local task store.
+
+    Opened once per process. On first use the tasks table is created and, if
+    empty, seeded from Sheet2 so existing tasks keep their row numbers.
+    After that row_index is only the store's own ordering: the sheet may be
+    edited by hand, so mirror writes locate rows by Task ID instead.
+    """
+    global _TASK_DB
+
+    if _TASK_DB is None:
+        with _TASK_DB_LOCK:
+            if _TASK_DB is None:
+                db = sqlite3.connect(TASK_DB_PATH, check_same_thread=False)
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS tasks ("
+                    "row_index INTEGER PRIMARY KEY, "
+                    # Nonzero while Sheet2 lags the row; bumped on every change
+                    "dirty INTEGER NOT NULL DEFAULT 0, "
+                    + ", ".join(f"{c} TEXT NOT NULL DEFAULT ''" for c in DB_COLUMNS)
+                    + ")"
+                )
+                db.execute("CREATE INDEX IF NOT EXISTS tasks_id ON tasks(id)")
+                db.execute("CREATE INDEX IF NOT EXISTS tasks_dirty ON tasks(dirty) WHERE dirty != 0")
+
+                if db.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 0:
+                    sheets = ensure_sheet2_with_header()
+                    result = sheets.values().get(
+                        spreadsheetId=SPREADSHEET_ID,
+                        range=f"{SHEET2}!A:M",
+                        fields="values",
+                    ).execute()
+                    rows = result.get("values", [])
+                    db.executemany(
+                        _DB_INSERT_SQL,
+                        [(i, 0, *_pad_row(row)) for i, row in enumerate(rows[1:], start=2)],
+                    )
+                db.commit()
+                _TASK_DB = db
+
+    return _TASK_DB
+
+
+def _pad_row(row):
+    """Return row as exactly NUM_COLS string cells, with Status stripped."""
+    row = [str(cell) for cell in row[:NUM_COLS]]
+    row += [""] * (NUM_COLS - len(row))
+    row[COL["Status"]] = row[COL["Status"]].strip()
+    return row
+
+
+def db_fetch_tasks(active_only=False):
+    """Return (row_number, row) pairs from the local task store, in sheet order."""
+    sql = _DB_SELECT_SQL
+    params = ()
+    if active_only:
+        sql += f" WHERE status NOT IN ({', '.join('?' * len(INACTIVE_STATUSES))})"
+        params = INACTIVE_STATUSES
+    db = get_task_db()
+    with _TASK_DB_LOCK:
+        found = db.execute(sql + " ORDER BY row_index", params).fetchall()
+    return [(r[0], list(r[1:])) for r in found]
+
+
+def db_find_task(task_id):
+    """Look up a task by Task ID. Returns (row_number, row) or (None, None)."""
+    db = get_task_db()
+    with _TASK_DB_LOCK:
+        found = db.execute(
+            _DB_SELECT_SQL + " WHERE id = ? ORDER BY row_index LIMIT 1", (task_id,)
+        ).fetchone()
+    if found is None:
+        return None, None
+    return found[0], list(found[1:])
+
+
+def db_insert_tasks(rows):
+    """Insert rows after the last task in the local store, marked dirty."""
+    db = get_task_db()
+    with _TASK_DB_LOCK, db:
+        last_row = db.execute("SELECT COALESCE(MAX(row_index), 1) FROM tasks").fetchone()[0]
+        db.executemany(
+            _DB_INSERT_SQL,
+            [(i, 1, *_pad_row(row)) for i, row in enumerate(rows, start=last_row + 1)],
+        )
+
+
+def db_update_task(row_number, row):
+    """Overwrite a task in the local store by row number, marking it dirty."""
+    db = get_task_db()
+    with _TASK_DB_LOCK, db:
+        db.execute(
+            f"UPDATE tasks SET dirty = dirty + 1, {', '.join(f'{c} = ?' for c in DB_COLUMNS)} "
+            "WHERE row_index = ?",
+            (*_pad_row(row), row_number),
+        )
+
+
+def db_mark_clean(versions):
+    """
+    Clear the dirty flag for (row_number, dirty) pairs read before a mirror
+    write, skipping rows changed again since so they are flushed once more.
+    """
+    db = get_task_db()
+    with _TASK_DB_LOCK, db:
+        db.executemany("UPDATE tasks SET dirty = 0 WHERE row_index = ? AND dirty = ?", versions)
+
+
+def flush_dirty_tasks():
+    """
+    Mirror every task changed in the local store since its last successful
+    Sheet2 write.
+
+    Rows are located by Task ID with one read of the ID column, so rows
+    added, sorted or deleted in the sheet by hand are never overwritten;
+    tasks not in the sheet yet, e.g. after a failed append, are appended.
+    A task stays dirty until its write succeeds, so the next flush retries it.
+    """
+    db = get_task_db()
+    with _TASK_DB_LOCK:
+        dirty = db.execute(_DB_DIRTY_SQL).fetchall()
+    if not dirty:
+        return
+
+    sheets = ensure_sheet2_with_header()
+    id_letter = chr(ord("A") + COL["ID"])
+    result = sheets.values().get(
+        spreadsheetId=SPREADSHEET_ID,
+        range=f"{SHEET2}!{id_letter}:{id_letter}",
+        fields="values",
+    ).execute()
+    sheet_rows = {}
+    for n, cell in enumerate(result.get("values", []), start=1):
+        if cell:
+            sheet_rows.setdefault(cell[0].strip(), n)
+
+    missing = []
+    for row_index, version, *row in dirty:
+        task_id = row[COL["ID"]].strip()
+        if task_id in sheet_rows:
+            write_task_rows(sheet_rows[task_id], [row])
+            db_mark_clean([(row_index, version)])
+        else:
+            missing.append((row_index, version, row))
+    if missing:
+        rows = [row for _, _, row in missing]
+        write_new_tasks(rows, [row[COL["ID"]].strip() for row in rows])
+        db_mark_clean([(row_index, version) for row_index, version, _ in missing])
+
+
+def save_new_tasks(rows, task_ids):
+    """
+    Persist newly created task rows.
+    With a local task store the rows are stored there first and Sheet2 is
+    brought up to date by flush_dirty_tasks(); either way the Sheet2 write
+    happens in the background.
+    """
+    if TASK_DB_PATH:
+        db_insert_tasks(rows)
+        submit_write(task_ids, flush_dirty_tasks)
+    else:
+        submit_write(task_ids, write_new_tasks, rows, task_ids)
+
+
+def save_task_row(row_number, row):
+    """Persist an updated task row (see save_new_tasks)."""
+    task_id = row[COL["ID"]].strip()
+    if TASK_DB_PATH:
+        db_update_task(row_number, row)
+        submit_write([task_id], flush_dirty_tasks)
+    else:
+        # row_number was just resolved from Sheet2 by find_task_row()
+        submit_write([task_id], write_task_rows, row_number, [row])
+
+
+def lookup_task(task_id):
+    """Find a task by Task ID in whichever store is the system of record."""
+    if TASK_DB_PATH:
+        return db_find_task(task_id)
+
+    # Wait for queued writes first, so a just-created task can be found
+    wait_for_pending_writes()
+    sheets = ensure_sheet2_with_header()
+    return find_task_row(sheets, task_id)
+
+
 def safe_get(row, idx, default=""):
     """Safely get a cell value from a row list."""
     try:
@@ -135,28 +777,225 @@ def safe_get(row, idx, default=""):
         return default
 
 
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%d-%m-%Y")
+
+# Formats worth trying for a given (separator, leading field width), in the
+# same priority order as DATE_FORMATS.
+_DATE_FORMATS_BY_SHAPE = {
+    ("-", 4): ("%Y-%m-%d",),
+    ("-", 2): ("%d-%m-%Y",),
+    ("-", 1): ("%d-%m-%Y",),
+    ("/", 2): ("%d/%m/%Y", "%m/%d/%Y"),
+    ("/", 1): ("%d/%m/%Y", "%m/%d/%Y"),
+}
+
+
 def parse_date(date_str):
     """Parse common date formats and return a date object."""
-    for fmt in ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%d-%m-%Y"):
+    if not isinstance(date_str, str):
+        return None
+    date_str = date_str.strip()
+    if not date_str:
+        return None
+
+    # Fast path: YYYY-MM-DD is what the API itself writes
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return datetime.date.fromisoformat(date_str)
+        except ValueError:
+            pass
+
+    # Pick candidate formats from the string's shape so that at most one
+    # or two strptime calls run instead of all four
+    sep = "-" if "-" in date_str else "/"
+    shape = (sep, len(date_str.split(sep, 1)[0]))
+    if shape in _DATE_FORMATS_BY_SHAPE:
+        # No other format can match this shape, so stop here on failure
+        for fmt in _DATE_FORMATS_BY_SHAPE[shape]:
+            try:
+                return datetime.datetime.strptime(date_str, fmt).date()
+            except ValueError:
+                continue
+        return None
+
+    # Anything unusual gets the full list, same as before
+    for fmt in DATE_FORMATS:
         try:
-            return datetime.datetime.strptime(date_str.strip(), fmt).date()
-        except (ValueError, AttributeError):
+            return datetime.datetime.strptime(date_str, fmt).date()
+        except ValueError:
             continue
     return None
 
 
+@lru_cache(maxsize=4)
+def _date_strings(ordinal):
+    d = datetime.date.fromordinal(ordinal)
+    return d.strftime("%Y-%m-%d"), d.strftime("%Y%m%d")
+
+
+def date_strings(day):
+    """
+    Return ("YYYY-MM-DD", "YYYYMMDD") for a date.
+    Memoized per day, since nearly every call is for today.
+    """
+    return _date_strings(day.toordinal())
+
+
+@lru_cache(maxsize=1024)
+def _client_code(client_name):
+    """First five non-space characters of a client name, upper-cased."""
+    return client_name.replace(" ", "")[:5].upper()
+
+
+@lru_cache(maxsize=1024)
+def _worker_clean(worker_name):
+    """Worker name with all spaces removed, as used in Task IDs."""
+    return worker_name.strip().replace(" ", "")
+
+
 def generate_task_id(client_name, worker_name, today):
     """
     Generate Task ID: CLIENTCODE_RANDOMNUM-WorkerName-YYYYMMDD
     Example: ASHRA_75076-Abhishek-20260223
     """
-    client_code = client_name.replace(" ", "")[:5].upper()
-    random_num = random.randint(10000, 99999)
-    date_str = today.strftime("%Y%m%d")
-    worker_clean = worker_name.strip().replace(" ", "")
+    client_code = _client_code(client_name)
+    random_num = secrets.randbelow(90000) + 10000  # 10000–99999
+    date_str = date_strings(today)[1]
+    worker_clean = _worker_clean(worker_name)
     return f"{client_code}_{random_num}-{worker_clean}-{date_str}"
 
 
+def build_sheet1_payload(rows):
+    """Turn Sheet1 rows into deduplicated workers / clients / task types."""
+    # Skip header row (assumed first row) so labels like
+    # "Worker Names", "Client Names", "Task Types" do not
+    # appear in dropdowns.
+    data_rows = rows[1:] if rows else []
+
+    workers = []
+    clients = []
+    task_types = []
+
+    for row in data_rows:
+        if len(row) >= 1 and row[0].strip():
+            workers.append(row[0].strip())
+        if len(row) >= 2 and row[1].strip():
+            clients.append(row[1].strip())
+        if len(row) >= 3 and row[2].strip():
+            task_types.append(row[2].strip())
+
+    return {
+        "workers": list(dict.fromkeys(workers)),      # deduplicate, preserve order
+        "clients": list(dict.fromkeys(clients)),
+        "taskTypes": list(dict.fromkeys(task_types))
+    }
+
+
+def build_task(row_index, row):
+    """Shape a Sheet2 row into the task dict returned by the API."""
+    row = row[:NUM_COLS]
+    if len(row) < NUM_COLS:
+        row += [""] * (NUM_COLS - len(row))
+    for idx in INTERNED_COLS:
+        if isinstance(row[idx], str):
+            row[idx] = sys.intern(row[idx])
+    return dict(zip(TASK_KEYS, (row_index, *row)))
+
+
+def stream_tasks(indexed_rows):
+    """
+    Stream {"tasks": [...]} for (row_number, row) pairs as a JSON response.
+
+    Task dicts are built and serialized STREAM_CHUNK_ROWS at a time, so the
+    full list of dicts never sits in memory and the client gets bytes early.
+    """
+    def generate():
+        yield b'{"tasks":['
+        sep = b""
+        batch = []
+        for i, row in indexed_rows:
+            batch.append(build_task(i, row))
+            if len(batch) >= STREAM_CHUNK_ROWS:
+                yield sep + orjson.dumps(batch)[1:-1]
+                sep = b","
+                batch = []
+        if batch:
+            yield sep + orjson.dumps(batch)[1:-1]
+        yield b"]}"
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
+def missing_task_field(data):
+    """Return the first required task field missing from data, or None."""
+    for field in ("taskType", "clientId", "tat", "taskDescription", "workerName"):
+        if not data.get(field, "").strip():
+            return field
+    return None
+
+
+def build_new_task_row(data, today):
+    """
+    Build a new Sheet2 row from a validated create-task payload.
+    Returns (task_id, row) with the row in exact Sheet2 column order.
+    """
+    today_str = date_strings(today)[0]
+
+    task_type = data["taskType"].strip()
+    client_id = data["clientId"].strip()
+    tat_str = data["tat"].strip()
+    description = data["taskDescription"].strip()
+    worker_name = data["workerName"].strip()
+    colleague = data.get("colleague", "NONE").strip() or "NONE"
+
+    # Calculate Total Days Required
+    tat_date = parse_date(tat_str)
+    if tat_date:
+        days_required = (tat_date - today).days
+    else:
+        days_required = ""
+
+    # Generate Task ID
+    task_id = generate_task_id(client_id, worker_name, today)
+
+    # Build row in exact Sheet2 column order
+    row = [""] * NUM_COLS
+    row[COL["Date"]] = today_str
+    row[COL["Tastype"]] = task_type
+    row[COL["Business ID"]] = client_id
+    row[COL["TAT"]] = tat_str
+    row[COL["Task Describtion"]] = description
+    row[COL["Employee Name"]] = worker_name
+    row[COL["Collegaue"]] = colleague
+    row[COL["Status"]] = "Pending"
+    row[COL["ChnageOnStatus"]] = ""
+    row[COL["Total DaysRequired"]] = str(days_required) if days_required != "" else ""
+    row[COL["Total Days taken"]] = ""
+    row[COL["Task Delivery Status"]] = ""
+    row[COL["ID"]] = task_id
+
+    return task_id, row
+
+
+def load_sheet1_payload():
+    """Return Sheet1 master data, served from cache while it is fresh."""
+    cached = _SHEET1_CACHE["payload"]
+    if cached is not None and time.time() - _SHEET1_CACHE["ts"] < SHEET1_CACHE_TTL:
+        return cached
+
+    sheets = get_service()
+    result = sheets.values().get(
+        spreadsheetId=SPREADSHEET_ID,
+        range=f"{SHEET1}!A:C",
+        fields="values",
+    ).execute()
+    rows = result.get("values", [])
+
+    payload = build_sheet1_payload(rows)
+    _SHEET1_CACHE.update(ts=time.time(), payload=payload)
+    return payload
+
+
 def get_delivery_status(tat_date, completion_date):
     """Return Task Delivery Status string based on dates."""
     days_late = (completion_date - tat_date).days
@@ -175,35 +1014,7 @@ def get_delivery_status(tat_date, completion_date):
 @app.route("/api/sheet1", methods=["GET"])
 def get_sheet1():
     try:
-        sheets = get_service()
-        result = sheets.values().get(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f"{SHEET1}!A:C"
-        ).execute()
-        rows = result.get("values", [])
-
-        # Skip header row (assumed first row) so labels like
-        # "Worker Names", "Client Names", "Task Types" do not
-        # appear in dropdowns.
-        data_rows = rows[1:] if rows else []
-
-        workers = []
-        clients = []
-        task_types = []
-
-        for row in data_rows:
-            if len(row) >= 1 and row[0].strip():
-                workers.append(row[0].strip())
-            if len(row) >= 2 and row[1].strip():
-                clients.append(row[1].strip())
-            if len(row) >= 3 and row[2].strip():
-                task_types.append(row[2].strip())
-
-        return jsonify({
-            "workers": list(dict.fromkeys(workers)),      # deduplicate, preserve order
-            "clients": list(dict.fromkeys(clients)),
-            "taskTypes": list(dict.fromkeys(task_types))
-        })
+        return jsonify(load_sheet1_payload())
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -215,10 +1026,15 @@ def get_sheet1():
 @app.route("/api/tasks", methods=["GET"])
 def get_tasks():
     try:
+        if TASK_DB_PATH:
+            return stream_tasks(db_fetch_tasks())
+
+        wait_for_pending_writes()
         sheets = ensure_sheet2_with_header()
         result = sheets.values().get(
             spreadsheetId=SPREADSHEET_ID,
-            range=f"{SHEET2}!A:M"
+            range=f"{SHEET2}!A:M",
+            fields="values",
         ).execute()
         rows = result.get("values", [])
 
@@ -226,28 +1042,7 @@ def get_tasks():
             return jsonify({"tasks": []})
 
         # First row is headers — skip it
-        headers = rows[0] if rows else []
-        tasks = []
-        for i, row in enumerate(rows[1:], start=2):  # start=2 for sheet row number
-            task = {
-                "rowIndex": i,
-                "Date": safe_get(row, COL["Date"]),
-                "Tastype": safe_get(row, COL["Tastype"]),
-                "Business ID": safe_get(row, COL["Business ID"]),
-                "TAT": safe_get(row, COL["TAT"]),
-                "Task Describtion": safe_get(row, COL["Task Describtion"]),
-                "Employee Name": safe_get(row, COL["Employee Name"]),
-                "Collegaue": safe_get(row, COL["Collegaue"]),
-                "Status": safe_get(row, COL["Status"]),
-                "ChnageOnStatus": safe_get(row, COL["ChnageOnStatus"]),
-                "Total DaysRequired": safe_get(row, COL["Total DaysRequired"]),
-                "Total Days taken": safe_get(row, COL["Total Days taken"]),
-                "Task Delivery Status": safe_get(row, COL["Task Delivery Status"]),
-                "ID": safe_get(row, COL["ID"]),
-            }
-            tasks.append(task)
-
-        return jsonify({"tasks": tasks})
+        return stream_tasks(enumerate(rows[1:], start=2))  # start=2 for sheet row number
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -259,39 +1054,13 @@ def get_tasks():
 @app.route("/api/tasks/active", methods=["GET"])
 def get_active_tasks():
     try:
-        sheets = ensure_sheet2_with_header()
-        result = sheets.values().get(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f"{SHEET2}!A:M"
-        ).execute()
-        rows = result.get("values", [])
-
-        if not rows:
-            return jsonify({"tasks": []})
+        if TASK_DB_PATH:
+            tasks = [build_task(i, row) for i, row in db_fetch_tasks(active_only=True)]
+            return jsonify({"tasks": tasks})
 
-        excluded = {"Completed", "Cancelled"}
-        tasks = []
-        for i, row in enumerate(rows[1:], start=2):
-            status = safe_get(row, COL["Status"]).strip()
-            if status in excluded:
-                continue
-            task = {
-                "rowIndex": i,
-                "Date": safe_get(row, COL["Date"]),
-                "Tastype": safe_get(row, COL["Tastype"]),
-                "Business ID": safe_get(row, COL["Business ID"]),
-                "TAT": safe_get(row, COL["TAT"]),
-                "Task Describtion": safe_get(row, COL["Task Describtion"]),
-                "Employee Name": safe_get(row, COL["Employee Name"]),
-                "Collegaue": safe_get(row, COL["Collegaue"]),
-                "Status": safe_get(row, COL["Status"]),
-                "ChnageOnStatus": safe_get(row, COL["ChnageOnStatus"]),
-                "Total DaysRequired": safe_get(row, COL["Total DaysRequired"]),
-                "Total Days taken": safe_get(row, COL["Total Days taken"]),
-                "Task Delivery Status": safe_get(row, COL["Task Delivery Status"]),
-                "ID": safe_get(row, COL["ID"]),
-            }
-            tasks.append(task)
+        wait_for_pending_writes()
+        sheets = ensure_sheet2_with_header()
+        tasks = [build_task(i, row) for i, row in fetch_active_task_rows(sheets)]
 
         return jsonify({"tasks": tasks})
     except Exception as e:
@@ -308,63 +1077,64 @@ def create_task():
         data = request.get_json()
 
         # Validate required fields
-        required = ["taskType", "clientId", "tat", "taskDescription", "workerName"]
-        for field in required:
-            if not data.get(field, "").strip():
-                return jsonify({"error": f"Missing required field: {field}"}), 400
-
-        today = datetime.date.today()
-        today_str = today.strftime("%Y-%m-%d")
-
-        task_type = data["taskType"].strip()
-        client_id = data["clientId"].strip()
-        tat_str = data["tat"].strip()
-        description = data["taskDescription"].strip()
-        worker_name = data["workerName"].strip()
-        colleague = data.get("colleague", "NONE").strip() or "NONE"
-
-        # Calculate Total Days Required
-        tat_date = parse_date(tat_str)
-        if tat_date:
-            days_required = (tat_date - today).days
-        else:
-            days_required = ""
-
-        # Generate Task ID
-        task_id = generate_task_id(client_id, worker_name, today)
-
-        # Build row in exact Sheet2 column order
-        row = [""] * NUM_COLS
-        row[COL["Date"]] = today_str
-        row[COL["Tastype"]] = task_type
-        row[COL["Business ID"]] = client_id
-        row[COL["TAT"]] = tat_str
-        row[COL["Task Describtion"]] = description
-        row[COL["Employee Name"]] = worker_name
-        row[COL["Collegaue"]] = colleague
-        row[COL["Status"]] = "Pending"
-        row[COL["ChnageOnStatus"]] = ""
-        row[COL["Total DaysRequired"]] = str(days_required) if days_required != "" else ""
-        row[COL["Total Days taken"]] = ""
-        row[COL["Task Delivery Status"]] = ""
-        row[COL["ID"]] = task_id
+        missing = missing_task_field(data)
+        if missing:
+            return jsonify({"error": f"Missing required field: {missing}"}), 400
 
-        sheets = ensure_sheet2_with_header()
+        task_id, row = build_new_task_row(data, datetime.date.today())
 
-        # Append the data row
-        sheets.values().append(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f"{SHEET2}!A:M",
-            valueInputOption="RAW",
-            insertDataOption="INSERT_ROWS",
-            body={"values": [row]}
-        ).execute()
+        # Save the task; the Sheet2 write happens in the background
+        save_new_tasks([row], [task_id])
 
         return jsonify({
             "success": True,
             "taskId": task_id,
-            "message": f"Task created successfully! ID: {task_id}"
-        })
+            "message": f"Task queued for creation. ID: {task_id}"
+        }), 202
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+# ─────────────────────────────────────────────
+#  POST /api/tasks/bulk
+#  Appends several task rows to Sheet2 in one call
+# ─────────────────────────────────────────────
+@app.route("/api/tasks/bulk", methods=["POST"])
+def create_tasks_bulk():
+    try:
+        data = request.get_json()
+        items = (data or {}).get("tasks")
+
+        if not isinstance(items, list) or not items:
+            return jsonify({"error": "tasks must be a non-empty list"}), 400
+        if len(items) > MAX_BULK_TASKS:
+            return jsonify({"error": f"At most {MAX_BULK_TASKS} tasks can be created at once"}), 400
+
+        # Validate every task before writing any of them
+        for n, item in enumerate(items, start=1):
+            if not isinstance(item, dict):
+                return jsonify({"error": f"Task {n}: expected an object"}), 400
+            missing = missing_task_field(item)
+            if missing:
+                return jsonify({"error": f"Task {n}: Missing required field: {missing}"}), 400
+
+        today = datetime.date.today()
+        task_ids = []
+        rows = []
+        for item in items:
+            task_id, row = build_new_task_row(item, today)
+            task_ids.append(task_id)
+            rows.append(row)
+
+        # Save all rows; Sheet2 gets them in a single background write
+        save_new_tasks(rows, task_ids)
+
+        return jsonify({
+            "success": True,
+            "taskIds": task_ids,
+            "message": f"{len(task_ids)} tasks queued for creation."
+        }), 202
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -386,27 +1156,16 @@ def update_task():
         if not task_id:
             return jsonify({"error": "taskId is required"}), 400
 
-        # Ensure Sheet2 and header exist, then read all rows to find the target
-        sheets = ensure_sheet2_with_header()
-        result = sheets.values().get(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f"{SHEET2}!A:M"
-        ).execute()
-        rows = result.get("values", [])
-
-        target_row_index = None  # 1-indexed sheet row
-        target_row = None
-        for i, row in enumerate(rows):
-            if safe_get(row, COL["ID"]).strip() == task_id:
-                target_row_index = i + 1  # Sheets is 1-indexed
-                target_row = list(row) + [""] * (NUM_COLS - len(row))
-                break
+        # Locate the target row
+        target_row_index, target_row = lookup_task(task_id)  # 1-indexed sheet row
 
         if target_row is None:
             return jsonify({"error": f"Task ID '{task_id}' not found"}), 404
 
+        target_row = list(target_row) + [""] * (NUM_COLS - len(target_row))
+
         today = datetime.date.today()
-        today_str = today.strftime("%Y-%m-%d")
+        today_str = date_strings(today)[0]
 
         # Track status changes (reassignment should be allowed without status update)
         existing_status = safe_get(target_row, COL["Status"]).strip()
@@ -425,7 +1184,7 @@ def update_task():
             target_row[COL["Collegaue"]] = (data.get("newColleague") or "NONE").strip() or "NONE"
 
         # If Completed or Cancelled — calculate total days taken and delivery status
-        if status_changed and new_status in ("Completed", "Cancelled"):
+        if status_changed and new_status in INACTIVE_STATUSES:
             assigned_date_str = safe_get(target_row, COL["Date"])
             tat_str = safe_get(target_row, COL["TAT"])
 
@@ -444,20 +1203,51 @@ def update_task():
         while len(target_row) < NUM_COLS:
             target_row.append("")
 
-        # Write back the updated row
-        range_notation = f"{SHEET2}!A{target_row_index}:M{target_row_index}"
-        sheets.values().update(
-            spreadsheetId=SPREADSHEET_ID,
-            range=range_notation,
-            valueInputOption="RAW",
-            body={"values": [target_row[:NUM_COLS]]}
-        ).execute()
+        # Save the updated row; the Sheet2 write happens in the background
+        save_task_row(target_row_index, target_row)
 
         return jsonify({
             "success": True,
-            "message": f"Task '{task_id}' updated successfully."
-        })
+            "message": f"Update to task '{task_id}' queued."
+        }), 202
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+# ─────────────────────────────────────────────
+#  GET /api/bootstrap
+#  Returns Sheet1 master data and ALL Sheet2 tasks in one call
+# ─────────────────────────────────────────────
+@app.route("/api/bootstrap", methods=["GET"])
+def get_bootstrap():
+    try:
+        if TASK_DB_PATH:
+            payload = dict(load_sheet1_payload())
+            payload["tasks"] = [build_task(i, row) for i, row in db_fetch_tasks()]
+            return jsonify(payload)
+
+        wait_for_pending_writes()
+        sheets = ensure_sheet2_with_header()
+        result = sheets.values().batchGet(
+            spreadsheetId=SPREADSHEET_ID,
+            ranges=[f"{SHEET1}!A:C", f"{SHEET2}!A:M"],
+            fields="valueRanges.values",
+        ).execute()
+        value_ranges = result.get("valueRanges", [])
+        sheet1_rows = value_ranges[0].get("values", []) if len(value_ranges) > 0 else []
+        sheet2_rows = value_ranges[1].get("values", []) if len(value_ranges) > 1 else []
+
+        sheet1_payload = build_sheet1_payload(sheet1_rows)
+        _SHEET1_CACHE.update(ts=time.time(), payload=sheet1_payload)
+
+        payload = dict(sheet1_payload)
+        payload["tasks"] = [
+            build_task(i, row)
+            for i, row in enumerate(sheet2_rows[1:], start=2)
+        ]
 
+        return jsonify(payload)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -485,6 +1275,7 @@ def root():
     <li><a href='/api/sheet1'>/api/sheet1</a> — Master data (workers, clients, task types)</li>
     <li><a href='/api/tasks'>/api/tasks</a> — All tasks</li>
     <li><a href='/api/tasks/active'>/api/tasks/active</a> — Active tasks only</li>
+    <li><a href='/api/bootstrap'>/api/bootstrap</a> — Master data + all tasks in one call</li>
     </ul>
     </div></body></html>
     """, 200
@@ -501,7 +1292,12 @@ def health():
         "message": "Reputes Work Tracker API is running",
         "spreadsheet_configured": sheet_ok,
         "sheet1": SHEET1,
-        "sheet2": SHEET2
+        "sheet2": SHEET2,
+        "task_store": "sqlite" if TASK_DB_PATH else "sheets",
+        "failed_writes": {
+            "count": _FAILED_WRITE_COUNT,
+            "recent_task_ids": list(_FAILED_WRITE_IDS),
+        },
     })
 
 
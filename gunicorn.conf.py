@@ -0,0 +1,18 @@
+# Gunicorn settings for production, picked up automatically by:
+#   gunicorn app:app
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', os.getenv('FLASK_PORT', '5000'))}"
+
+# Every endpoint mostly waits on the Google Sheets API, so gevent workers
+# let one process keep serving requests while others are waiting on I/O.
+# gunicorn monkey-patches the standard library before loading the app.
+worker_class = "gevent"
+worker_connections = int(os.getenv("WORKER_CONNECTIONS", "100"))
+
+# One process by default: queued Sheet2 writes, the Sheet1 cache and the
+# Sheets client all live in-process, and a single worker keeps reads
+# consistent with writes that are still being flushed.
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+timeout = 60
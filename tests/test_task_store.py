@@ -0,0 +1,361 @@
+import os
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+import app
+
+HEADER = list(app.TASK_KEYS[1:])
+
+
+def http_error(status):
+    return HttpError(httplib2.Response({"status": status}), b"")
+
+
+def task_row(task_id, status="Pending", worker="Asha"):
+    row = [""] * app.NUM_COLS
+    row[app.COL["Date"]] = "2026-01-01"
+    row[app.COL["Tastype"]] = "Audit"
+    row[app.COL["Business ID"]] = "ACME"
+    row[app.COL["TAT"]] = "2026-01-10"
+    row[app.COL["Employee Name"]] = worker
+    row[app.COL["Collegaue"]] = "NONE"
+    row[app.COL["Status"]] = status
+    row[app.COL["ID"]] = task_id
+    return row
+
+
+class _Call:
+    def __init__(self, fn):
+        self.fn = fn
+
+    def execute(self, **kwargs):
+        return self.fn()
+
+
+class FakeSheets:
+    """In-memory stand-in for the spreadsheets() handle, Sheet2 only."""
+
+    def __init__(self, rows):
+        self.rows = [list(r) for r in rows]
+        self.metadata = []
+        self.reads = []
+        self.append_errors = []  # (error, applied) pairs raised by the next appends
+
+    def _bounds(self, a1):
+        nums = [int(n) for n in re.findall(r"[A-Z]+(\d+)", a1)]
+        if not nums:
+            return 1, len(self.rows)
+        return nums[0], nums[-1] if a1[-1].isdigit() else len(self.rows)
+
+    def _read(self, a1):
+        """Read an A1 range, trimming empty cells and rows as the API does."""
+        first, last = self._bounds(a1)
+        letters = re.findall(r"[A-Z]+", a1)
+        lo, hi = ord(letters[0]) - ord("A"), ord(letters[-1]) - ord("A")
+        rows = [list(r[lo:hi + 1]) for r in self.rows[first - 1:last]]
+        for row in rows:
+            while row and row[-1] == "":
+                row.pop()
+        while rows and not rows[-1]:
+            rows.pop()
+        return {"values": rows} if rows else {}
+
+    def values(self):
+        return self
+
+    def get(self, spreadsheetId, range, **kwargs):
+        self.reads.append(range)
+        return _Call(lambda: self._read(range.split("!", 1)[1]))
+
+    def batchGet(self, spreadsheetId, ranges, **kwargs):
+        return _Call(lambda: {"valueRanges": [self._read(r.split("!", 1)[1]) for r in ranges]})
+
+    def append(self, spreadsheetId, range, body, **kwargs):
+        def fn():
+            error, applied = self.append_errors.pop(0) if self.append_errors else (None, True)
+            start = len(self.rows) + 1
+            if applied:
+                self.rows.extend(list(r) for r in body["values"])
+            if error is not None:
+                raise error
+            return {"updates": {"updatedRange": f"{app.SHEET2}!A{start}:M{len(self.rows)}"}}
+        return _Call(fn)
+
+    def update(self, spreadsheetId, range, body, **kwargs):
+        def fn():
+            first, _ = self._bounds(range.split("!", 1)[1])
+            for offset, values in enumerate(body["values"]):
+                self.rows[first - 1 + offset] = list(values)
+            return {}
+        return _Call(fn)
+
+    def batchUpdate(self, spreadsheetId, body):
+        def fn():
+            for req in body["requests"]:
+                self.metadata.append(req["createDeveloperMetadata"]["developerMetadata"])
+            return {"replies": [{} for _ in body["requests"]]}
+        return _Call(fn)
+
+    def developerMetadata(self):
+        return self
+
+    def search(self, spreadsheetId, body):
+        lookup = body["dataFilters"][0]["developerMetadataLookup"]
+        matches = []
+        for meta in self.metadata:
+            if (meta["metadataKey"], meta["metadataValue"]) != (lookup["metadataKey"], lookup["metadataValue"]):
+                continue
+            # Like the real API, leave out zero-valued fields such as sheetId 0
+            dim_range = {k: v for k, v in meta["location"]["dimensionRange"].items() if v != 0}
+            matches.append({"developerMetadata": dict(meta, location={"dimensionRange": dim_range})})
+        return _Call(lambda: {"matchedDeveloperMetadata": matches} if matches else {})
+
+    def ids(self):
+        return [app.safe_get(r, app.COL["ID"]) for r in self.rows[1:]]
+
+
+class ApiTestCase(unittest.TestCase):
+    def create_task(self):
+        resp = self.client.post("/api/tasks/create", json={
+            "taskType": "Audit",
+            "clientId": "ACME",
+            "tat": "2026-12-31",
+            "taskDescription": "Quarterly review",
+            "workerName": "Asha",
+        })
+        app.wait_for_pending_writes()
+        self.assertEqual(resp.status_code, 202)
+        return resp.get_json()["taskId"]
+
+
+class TaskStoreTests(ApiTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.sheets = FakeSheets([
+            HEADER,
+            task_row("T1"),
+            task_row("T2", status=" Completed "),
+            task_row("T3", status="In Progress"),
+        ])
+        patches = [
+            mock.patch.object(app, "TASK_DB_PATH", os.path.join(self.tmp.name, "tasks.db")),
+            mock.patch.object(app, "_TASK_DB", None),
+            mock.patch.object(app, "_SHEETS_SINGLETON", self.sheets),
+            mock.patch.object(app, "_SHEET2_READY", True),
+            mock.patch.object(app, "_SHEET2_ID", 0),
+            mock.patch.object(app, "WRITE_RETRY_DELAY", 0),
+            mock.patch.object(app, "_FAILED_WRITE_COUNT", 0),
+            mock.patch.object(app, "_FAILED_WRITE_IDS", app.deque(maxlen=50)),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.client = app.app.test_client()
+
+    def tearDown(self):
+        app.wait_for_pending_writes()
+        if app._TASK_DB is not None:
+            app._TASK_DB.close()
+        self.tmp.cleanup()
+
+    def test_active_tasks_exclude_completed_and_cancelled(self):
+        resp = self.client.get("/api/tasks/active")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual([t["ID"] for t in resp.get_json()["tasks"]], ["T1", "T3"])
+
+    def test_create_appends_after_rows_added_by_hand(self):
+        app.get_task_db()  # seed from the sheet
+        self.sheets.rows.append(task_row("MANUAL"))
+
+        resp = self.client.post("/api/tasks/create", json={
+            "taskType": "Audit",
+            "clientId": "ACME",
+            "tat": "2026-12-31",
+            "taskDescription": "Quarterly review",
+            "workerName": "Asha",
+        })
+        app.wait_for_pending_writes()
+
+        self.assertEqual(resp.status_code, 202)
+        task_id = resp.get_json()["taskId"]
+        self.assertEqual(self.sheets.ids(), ["T1", "T2", "T3", "MANUAL", task_id])
+        self.assertEqual(self.sheets.metadata[0]["metadataValue"], task_id)
+        self.assertEqual(self.sheets.metadata[0]["location"]["dimensionRange"]["startIndex"], 5)
+        tasks = self.client.get("/api/tasks").get_json()["tasks"]
+        self.assertIn(task_id, [t["ID"] for t in tasks])
+
+    def test_update_mirrors_to_row_found_by_task_id(self):
+        app.get_task_db()  # seed from the sheet
+        # Someone sorts the sheet by hand after seeding
+        self.sheets.rows[1:] = list(reversed(self.sheets.rows[1:]))
+
+        resp = self.client.put("/api/tasks/update", json={"taskId": "T1", "newStatus": "Completed"})
+        app.wait_for_pending_writes()
+
+        self.assertEqual(resp.status_code, 202)
+        self.assertEqual(self.sheets.ids(), ["T3", "T2", "T1"])
+        status = app.COL["Status"]
+        self.assertEqual(self.sheets.rows[3][status], "Completed")
+        self.assertEqual(self.sheets.rows[1][status], "In Progress")
+        active = self.client.get("/api/tasks/active").get_json()["tasks"]
+        self.assertEqual([t["ID"] for t in active], ["T3"])
+
+    def test_find_task_row_reads_only_the_tagged_row(self):
+        app.tag_task_rows(self.sheets, ["T3"], 4)
+
+        row_number, row = app.find_task_row(self.sheets, "T3")
+
+        self.assertEqual(row_number, 4)
+        self.assertEqual(row[app.COL["ID"]], "T3")
+        self.assertEqual(self.sheets.reads, [f"{app.SHEET2}!A4:M4"])
+
+    def test_find_task_row_scans_when_tagged_row_holds_another_task(self):
+        app.tag_task_rows(self.sheets, ["T1"], 2)
+        # Someone sorts the sheet by hand, so row 2 now holds T3
+        self.sheets.rows[1:] = list(reversed(self.sheets.rows[1:]))
+
+        row_number, row = app.find_task_row(self.sheets, "T1")
+
+        self.assertEqual(row_number, 4)
+        self.assertEqual(row[app.COL["ID"]], "T1")
+        self.assertEqual(self.sheets.reads, [f"{app.SHEET2}!A2:M2", f"{app.SHEET2}!A:M"])
+
+    def _scattered_sheet(self):
+        self.sheets.rows = [
+            HEADER,
+            task_row("T1"),
+            [],
+            task_row("T2", status="Completed"),
+            ["2026-01-02", "Audit"],
+            task_row("T3", status=" Cancelled "),
+            task_row("T4", status="In Progress"),
+            task_row("T5", status="Completed"),
+            task_row("T6", status=""),
+            [],
+            ["2026-01-03"],
+            [],
+        ]
+        full = self.sheets._read("A:M")["values"]
+        status = app.COL["Status"]
+        return [
+            (n, row)
+            for n, row in enumerate(full[1:], start=2)
+            if app.safe_get(row, status).strip() not in app.INACTIVE_STATUSES
+        ]
+
+    def test_fetch_active_task_rows_matches_full_sheet_filter(self):
+        expected = self._scattered_sheet()
+
+        active = app.fetch_active_task_rows(self.sheets)
+
+        self.assertEqual([n for n, _ in active], [2, 3, 5, 7, 9, 10, 11])
+        self.assertEqual(active, expected)
+        self.assertNotIn(f"{app.SHEET2}!A:M", self.sheets.reads)
+
+    def test_fetch_active_task_rows_reads_whole_sheet_when_too_scattered(self):
+        expected = self._scattered_sheet()
+
+        with mock.patch.object(app, "MAX_ACTIVE_RANGES", 2):
+            active = app.fetch_active_task_rows(self.sheets)
+
+        self.assertEqual(active, expected)
+        self.assertEqual(self.sheets.reads[-1], f"{app.SHEET2}!A:M")
+
+    def fail_next_append(self):
+        self.sheets.append_errors = [(http_error(429), False)] * (app.WRITE_RETRIES + 1)
+
+    def dirty_count(self):
+        return app.get_task_db().execute("SELECT COUNT(*) FROM tasks WHERE dirty != 0").fetchone()[0]
+
+    def test_failed_append_is_flushed_by_next_write(self):
+        self.fail_next_append()
+        with self.assertLogs(app.app.logger, "ERROR"):
+            first = self.create_task()
+        self.assertEqual(self.sheets.ids(), ["T1", "T2", "T3"])
+        self.assertEqual(self.dirty_count(), 1)
+
+        second = self.create_task()
+
+        self.assertEqual(self.sheets.ids(), ["T1", "T2", "T3", first, second])
+        self.assertEqual(self.dirty_count(), 0)
+
+    def test_update_of_unmirrored_task_appends_updated_row(self):
+        self.fail_next_append()
+        with self.assertLogs(app.app.logger, "ERROR"):
+            task_id = self.create_task()
+
+        resp = self.client.put("/api/tasks/update", json={"taskId": task_id, "newStatus": "In Progress"})
+        app.wait_for_pending_writes()
+
+        self.assertEqual(resp.status_code, 202)
+        self.assertEqual(self.sheets.ids(), ["T1", "T2", "T3", task_id])
+        self.assertEqual(self.sheets.rows[4][app.COL["Status"]], "In Progress")
+        self.assertEqual(self.dirty_count(), 0)
+
+    def test_update_unknown_task_is_404(self):
+        resp = self.client.put("/api/tasks/update", json={"taskId": "NOPE"})
+
+        self.assertEqual(resp.status_code, 404)
+
+
+class SheetsOnlyTests(ApiTestCase):
+    """Sheet2 as the system of record, with no local task store."""
+
+    def setUp(self):
+        self.sheets = FakeSheets([HEADER, task_row("T1"), task_row("T2"), task_row("T3")])
+        patches = [
+            mock.patch.object(app, "TASK_DB_PATH", ""),
+            mock.patch.object(app, "_SHEETS_SINGLETON", self.sheets),
+            mock.patch.object(app, "_SHEET2_READY", True),
+            mock.patch.object(app, "_SHEET2_ID", 0),
+            mock.patch.object(app, "WRITE_RETRY_DELAY", 0),
+            mock.patch.object(app, "_FAILED_WRITE_COUNT", 0),
+            mock.patch.object(app, "_FAILED_WRITE_IDS", app.deque(maxlen=50)),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.client = app.app.test_client()
+
+    def test_create_retries_rate_limited_append(self):
+        self.sheets.append_errors = [(http_error(429), False)]
+
+        task_id = self.create_task()
+
+        self.assertEqual(self.sheets.ids(), ["T1", "T2", "T3", task_id])
+        self.assertEqual(self.sheets.metadata[0]["location"]["dimensionRange"]["startIndex"], 4)
+
+    def test_create_does_not_repeat_append_applied_before_server_error(self):
+        self.sheets.append_errors = [(http_error(503), True)]
+
+        task_id = self.create_task()
+
+        self.assertEqual(self.sheets.ids(), ["T1", "T2", "T3", task_id])
+        self.assertEqual(self.sheets.metadata[0]["location"]["dimensionRange"]["startIndex"], 4)
+
+    def test_create_retries_dropped_connection_that_wrote_nothing(self):
+        self.sheets.append_errors = [(ConnectionError("reset"), False)]
+
+        task_id = self.create_task()
+
+        self.assertEqual(self.sheets.ids(), ["T1", "T2", "T3", task_id])
+
+    def test_failed_create_is_reported_by_health(self):
+        self.sheets.append_errors = [(http_error(429), False)] * (app.WRITE_RETRIES + 1)
+
+        with self.assertLogs(app.app.logger, "ERROR"):
+            task_id = self.create_task()
+
+        self.assertEqual(self.sheets.ids(), ["T1", "T2", "T3"])
+        failed = self.client.get("/api/health").get_json()["failed_writes"]
+        self.assertEqual(failed, {"count": 1, "recent_task_ids": [task_id]})
+
+
+if __name__ == "__main__":
+    unittest.main()